@@ -4,16 +4,25 @@ A universal file-to-dataset converter for AI training
 """
 import gradio as gr
 import os
+import asyncio
 import json
+import functools
+import gc
+import importlib
+import itertools
+import mmap
+import multiprocessing
+import pathlib
+import queue
 import tempfile
-from typing import Dict, Any, List, Tuple
-import shutil
+import threading
+import unicodedata
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
-# Import converters
-from converters.pdf_converter import PDFConverter
-from converters.word_converter import WordConverter
-from converters.excel_converter import ExcelConverter
-from converters.text_converter import TextConverter
+from converters import CONVERTER_REGISTRY
+from converters.base_converter import MappedFile
 
 # Import utilities
 from utils.cleaner import DataCleaner
@@ -24,22 +33,443 @@ from utils.validator import FileValidator
 from chatbot import DataChatbot
 
 
+# Converter for each supported file extension, given as (module, class name)
+# so heavy backends like PyMuPDF or pandas are only imported when needed
+CONVERTERS = {
+    f'.{ext}': ('converters', class_name)
+    for ext, class_name in CONVERTER_REGISTRY.items()
+}
+
+# Text and CSV parsing is cheap and mostly I/O, so threads are enough there
+THREAD_FRIENDLY_EXTENSIONS = {'.txt', '.csv'}
+
+# Batch workers are started from a fork server (spawned where there is none):
+# forking this multi-threaded process can deadlock children on inherited locks
+_WORKER_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Batch workers run a full garbage collection after this many files
+GC_EVERY_N_FILES = 20
+_rendered_count = itertools.count(1)
+
+# Number of characters shown in the output preview box
+PREVIEW_CHARS = 2000
+
+
+@functools.lru_cache(maxsize=None)
+def _get_converter_class(ext: str) -> Optional[type]:
+    """Resolve (and import on first use) the converter class for an extension"""
+    spec = CONVERTERS.get(ext)
+    if spec is None or isinstance(spec, type):
+        return spec
+    module_name, class_name = spec
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+# Converter instances are kept per worker thread (and so per worker process)
+# and reused across a batch instead of being rebuilt for every file
+_converter_instances = threading.local()
+
+
+def _load_converter(converter_cls: type, file_path: str, stream: Any = None) -> Any:
+    """Return a converter of the given class loaded with file_path"""
+    if not hasattr(converter_cls, "load"):
+        # Plain registered classes without load() are built per file
+        if stream is None:
+            return converter_cls(file_path)
+        return converter_cls(file_path, stream=stream)
+    
+    instances = getattr(_converter_instances, "by_class", None)
+    if instances is None:
+        instances = _converter_instances.by_class = {}
+    
+    converter = instances.get(converter_cls)
+    if converter is None:
+        converter = instances[converter_cls] = converter_cls()
+    converter.load(file_path, stream)
+    return converter
+
+
+def _init_batch_worker(converters: Dict[str, Any]) -> None:
+    """Install the parent's converter table, including runtime registrations, in a new worker"""
+    CONVERTERS.update(converters)
+    _get_converter_class.cache_clear()
+
+
+def _max_workers() -> int:
+    """Number of batch workers, overridable via LOAD_DOCUMENTS_NUMBER_OF_THREADS"""
+    env_value = os.getenv("LOAD_DOCUMENTS_NUMBER_OF_THREADS")
+    if env_value and env_value.isdigit() and int(env_value) > 0:
+        return int(env_value)
+    return os.cpu_count() or 1
+
+
+def _prepare_file(
+    file_path: str,
+    output_format: str,
+    cleaning_options: Optional[Dict[str, bool]]
+) -> Dict[str, Any]:
+    """
+    Extract and clean a single file and pick the object to serialize
+    
+    Returns:
+        Dictionary with status, output_name, document, preview and stats
+        (output_name is None when the file could not be converted)
+    """
+    result = {
+        "status": "",
+        "output_name": None,
+        "document": None,
+        "preview": "",
+        "stats": ""
+    }
+    
+    try:
+        # Parse the path once; ext, stem and name are reused below
+        path = pathlib.Path(file_path)
+        ext = path.suffix.lower()
+        
+        converter_cls = _get_converter_class(ext)
+        if converter_cls is None:
+            result["status"] = f"Unsupported file type: {ext}"
+            return result
+        
+        # Extract data
+        if getattr(converter_cls, "supports_stream", False):
+            # Map the file once and let the backend demand-page it
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                converter = _load_converter(converter_cls, file_path, MappedFile(mapped))
+                extracted_data = converter.extract()
+                converter.stream = None
+        else:
+            extracted_data = _load_converter(converter_cls, file_path).extract()
+        
+        if "error" in extracted_data:
+            result["status"] = extracted_data["error"]
+            return result
+        
+        # Normalize to NFC once here so cleaning and matching see a single form
+        text_changed = False
+        if "full_text" in extracted_data and not unicodedata.is_normalized('NFC', extracted_data["full_text"]):
+            extracted_data["full_text"] = unicodedata.normalize('NFC', extracted_data["full_text"])
+            text_changed = True
+        
+        # Clean data if requested
+        if cleaning_options is not None and "full_text" in extracted_data:
+            extracted_data["full_text"] = DataCleaner.clean_text(
+                extracted_data["full_text"], 
+                cleaning_options
+            )
+            text_changed = True
+        
+        # Generate statistics
+        stats = DataFormatter.get_statistics(extracted_data, text_changed)
+        result["stats"] = _format_statistics(stats)
+        
+        # Format output
+        base_name = path.stem
+        
+        if output_format == "JSON":
+            output_name = f"{base_name}_converted.json"
+            document = extracted_data
+            
+        elif output_format == "CSV":
+            output_name = f"{base_name}_converted.csv"
+            
+            # Extract tabular data for CSV
+            document = _extract_tabular_data(extracted_data)
+            if not document[1]:
+                result["status"] = "No tabular data found for CSV export"
+                return result
+            
+            result["preview"] = f"CSV file created with {len(document[1])} rows"
+            
+        elif output_format == "XML":
+            output_name = f"{base_name}_converted.xml"
+            document = extracted_data
+        
+        elif output_format == "AI Training Format":
+            output_name = f"{base_name}_ai_training.json"
+            word_count = stats["word_count"] if "full_text" in extracted_data else None
+            document = DataFormatter.create_ai_training_format(extracted_data, word_count)
+        
+        elif output_format == "AI Training Format (JSONL)":
+            output_name = f"{base_name}_ai_training.jsonl"
+            if extracted_data.get("lines_truncated"):
+                # Training records cover every line, not just the capped list
+                extracted_data["lines"] = converter_cls.iter_lines(file_path, extracted_data["encoding"])
+            # A lazy generator: records are built while they are being written
+            document = _iter_training_records(extracted_data, cleaning_options)
+        
+        else:
+            result["status"] = f"Unsupported output format: {output_format}"
+            return result
+        
+        result["output_name"] = output_name
+        result["document"] = document
+        return result
+        
+    except Exception as e:
+        result["status"] = f"Error processing file: {str(e)}"
+        return result
+
+
+def _render_file(
+    file_path: str,
+    output_format: str,
+    cleaning_options: Optional[Dict[str, bool]]
+) -> Dict[str, Any]:
+    """
+    Extract, clean and format a single file into an in-memory payload
+    
+    Kept at module level so batch workers in other processes can pickle it.
+    
+    Returns:
+        Dictionary with status, output_name, payload (UTF-8 bytes) and stats
+        (output_name is None when the file could not be converted)
+    """
+    result = _prepare_file(file_path, output_format, cleaning_options)
+    document = result.pop("document")
+    result["payload"] = None
+    if result["output_name"] is None:
+        return result
+    
+    try:
+        if output_format == "CSV":
+            payload = DataFormatter.to_csv_rows(*document).encode('utf-8')
+        elif output_format == "AI Training Format (JSONL)":
+            payload = DataFormatter.to_jsonl_bytes(document)
+        elif output_format == "XML":
+            payload = DataFormatter.to_xml(document).encode('utf-8')
+        else:
+            payload = DataFormatter.to_json_bytes(document)
+    except Exception as e:
+        result["status"] = f"Error processing file: {str(e)}"
+        result["output_name"] = None
+        return result
+    finally:
+        # The extracted document can be tens of MB; drop it before the payload travels on
+        del document
+    
+    result["payload"] = payload
+    return result
+
+
+def _render_one(args: Tuple[str, str, Optional[Dict[str, bool]]]) -> Dict[str, Any]:
+    """Batch parser entry point, unpacks a (file_path, output_format, cleaning_options) job"""
+    result = _render_file(*args)
+    
+    # Parsed documents (python-docx and openpyxl object trees) can hold
+    # reference cycles that refcounting alone does not free, so collect
+    # them every few files to keep long-lived workers from growing
+    if next(_rendered_count) % GC_EVERY_N_FILES == 0:
+        gc.collect()
+    return result
+
+
+def _iter_training_records(
+    extracted_data: Dict[str, Any],
+    cleaning_options: Optional[Dict[str, bool]]
+) -> Iterator[Dict[str, Any]]:
+    """Yield JSONL training records, normalizing and cleaning each record's text like full_text"""
+    for record in DataFormatter.iter_ai_training_records(extracted_data):
+        # Records come from pages/paragraphs/lines, which were not normalized
+        if not unicodedata.is_normalized('NFC', record["input_text"]):
+            record["input_text"] = unicodedata.normalize('NFC', record["input_text"])
+        if cleaning_options is not None:
+            record["input_text"] = DataCleaner.clean_text(record["input_text"], cleaning_options)
+        yield record
+
+
+def _write_output(output_path: str, payload: bytes) -> None:
+    """Write a rendered payload to disk"""
+    with open(output_path, 'wb') as f:
+        f.write(payload)
+
+
+def _unique_name(name: str, taken: set) -> str:
+    """Return name, or name with a counter before its suffix if it is already taken"""
+    unique = name
+    if unique in taken:
+        stem, suffix = os.path.splitext(name)
+        counter = itertools.count(2)
+        while unique in taken:
+            unique = f"{stem}_{next(counter)}{suffix}"
+    taken.add(unique)
+    return unique
+
+
+async def _write_outputs(
+    write_queue: queue.Queue,
+    zip_file: zipfile.ZipFile,
+    output_dir: Optional[pathlib.Path],
+    record,
+    concurrency: int
+) -> None:
+    """
+    Drain rendered payloads from the write queue into the batch archive
+    
+    Payloads go straight into the open ZIP, so outputs are never written and
+    read back; they are also saved under output_dir when one is given. Each
+    payload gets its own task so slow storage does not hold up the next file.
+    A slot is reserved before an item is taken off the queue, so parsers
+    still block once `concurrency` writes are in flight. Inputs sharing a
+    stem (a.csv and a.txt) get numbered output names instead of duplicates.
+    """
+    slots = asyncio.Semaphore(concurrency)
+    # ZipFile allows one writer at a time
+    archive_lock = asyncio.Lock()
+    taken_names = set()
+    
+    async def write(file_name: str, output_name: str, payload: bytes):
+        try:
+            if output_dir is not None:
+                await asyncio.to_thread(_write_output, str(output_dir / output_name), payload)
+            async with archive_lock:
+                await asyncio.to_thread(zip_file.writestr, output_name, payload)
+            record(file_name, "", output_name)
+        except Exception as e:
+            record(file_name, f"Error writing output: {str(e)}", None)
+        finally:
+            slots.release()
+    
+    write_tasks = []
+    while True:
+        await slots.acquire()
+        item = await asyncio.to_thread(write_queue.get)
+        if item is None:
+            break
+        file_name, output_name, payload = item
+        output_name = _unique_name(output_name, taken_names)
+        write_tasks.append(asyncio.create_task(write(file_name, output_name, payload)))
+    
+    await asyncio.gather(*write_tasks)
+
+
+def _write_document(document: Any, output_format: str, output_path: str) -> None:
+    """Serialize a prepared document straight to disk without an in-memory copy"""
+    if output_format == "CSV":
+        DataFormatter.to_csv_rows(*document, output_path)
+        return
+    
+    if output_format == "XML":
+        with open(output_path, 'w', encoding='utf-8') as f:
+            DataFormatter.write_xml(document, f)
+        return
+    
+    with open(output_path, 'wb') as f:
+        if output_format == "AI Training Format (JSONL)":
+            DataFormatter.write_jsonl(document, f)
+        else:
+            DataFormatter.write_json(document, f)
+
+
+def _read_head(output_path: str, limit: int) -> Tuple[str, bool]:
+    """
+    Read the first characters of an output file
+    
+    Returns:
+        Tuple of (text, truncated)
+    """
+    with open(output_path, 'r', encoding='utf-8') as f:
+        head = f.read(limit + 1)
+    return head[:limit], len(head) > limit
+
+
+def _batch_sort_key(file_path: str) -> Tuple[str, int]:
+    """Sort key that orders batch inputs by (extension, size)"""
+    try:
+        size = os.path.getsize(file_path)
+    except OSError:
+        size = 0
+    return os.path.splitext(file_path)[1].lower(), size
+
+
+@functools.lru_cache(maxsize=16)
+def _cleaning_options(
+    clean_text: bool,
+    remove_urls: bool,
+    remove_extra_spaces: bool,
+    lowercase: bool
+) -> Optional[Dict[str, bool]]:
+    """
+    Build the cleaner options from the UI checkboxes (None disables cleaning)
+    
+    Cached so repeated conversions with the same settings share one dict;
+    callers must treat the result as read-only.
+    """
+    if not clean_text:
+        return None
+    return {
+        'remove_extra_spaces': remove_extra_spaces,
+        'remove_urls': remove_urls,
+        'lowercase': lowercase,
+        'remove_special_chars': False,
+        'remove_numbers': False
+    }
+
+
+def _extract_tabular_data(data: Dict[str, Any]) -> Tuple[List[Any], List[List[Any]]]:
+    """
+    Extract tabular data from extracted content
+    
+    Returns:
+        Tuple of (headers, rows), rows being plain lists in header order
+    """
+    records = data.get("data", data.get("all_data"))
+    if isinstance(records, dict):
+        # Column-oriented {column: [values]} data is already aligned
+        return list(records), [list(row) for row in zip(*records.values())]
+    if records is not None:
+        # Union of keys in first-seen order, since sheets may differ in columns
+        headers = list(dict.fromkeys(key for record in records for key in record))
+        return headers, [[record.get(key) for key in headers] for record in records]
+    
+    if "tables" in data and data["tables"]:
+        # Use the first table, its first row being the header
+        first_table = data["tables"][0]["data"]
+        if first_table and len(first_table) > 1:
+            headers = first_table[0]
+            width = len(headers)
+            return headers, [row[:width] for row in first_table[1:]]
+    return [], []
+
+
+def _format_statistics(stats: Dict[str, Any]) -> str:
+    """Format statistics for display"""
+    lines = ["**Document Statistics**", ""]
+    lines.extend(f"**{key.replace('_', ' ').title()}:** {value}" for key, value in stats.items())
+    
+    return "\n".join(lines) + "\n"
+
+
 class AIDataConverter:
     """Main application class for AI Data Conversion Tool"""
     
     def __init__(self):
-        self.output_dir = "output"
-        self._ensure_output_dir()
+        self.output_dir = pathlib.Path("output")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         self.cleaner = DataCleaner()
         self.formatter = DataFormatter()
         self.validator = FileValidator()
         self.chatbot = DataChatbot()
         self.last_converted_data = None  # Store last converted data for chatbot
     
-    def _ensure_output_dir(self):
-        """Ensure output directory exists"""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+    @staticmethod
+    def register_converter(ext: str, converter: Any):
+        """
+        Register (or replace) the converter used for a file extension
+        
+        Accepts a converter class or a (module, class name) pair that is
+        imported on first use. Batch workers receive the table when they
+        start, so a class must be importable from its module by name.
+        """
+        ext = ext.lower()
+        CONVERTERS[ext] = converter
+        _get_converter_class.cache_clear()
+        FileValidator.add_extension(ext, f"{ext.lstrip('.').upper()} File")
     
     def process_file(
         self,
@@ -62,137 +492,153 @@ class AIDataConverter:
             if not is_valid:
                 return validation_msg, "", None, ""
             
-            # Extract data based on file type
-            ext = os.path.splitext(file_path)[1].lower()
-            
-            if ext == '.pdf':
-                converter = PDFConverter(file_path)
-            elif ext in ['.docx', '.doc']:
-                converter = WordConverter(file_path)
-            elif ext in ['.xlsx', '.xls']:
-                converter = ExcelConverter(file_path)
-            elif ext in ['.txt', '.csv']:
-                converter = TextConverter(file_path)
-            else:
-                return f"Unsupported file type: {ext}", "", None, ""
-            
-            # Extract data
-            extracted_data = converter.extract()
-            
-            if "error" in extracted_data:
-                return extracted_data["error"], "", None, ""
-            
-            # Clean data if requested
-            if clean_text and "full_text" in extracted_data:
-                cleaning_options = {
-                    'remove_extra_spaces': remove_extra_spaces,
-                    'remove_urls': remove_urls,
-                    'lowercase': lowercase,
-                    'remove_special_chars': False,
-                    'remove_numbers': False
-                }
-                extracted_data["full_text"] = self.cleaner.clean_text(
-                    extracted_data["full_text"], 
-                    cleaning_options
-                )
-            
-            # Generate statistics
-            stats = self.formatter.get_statistics(extracted_data)
-            stats_text = self._format_statistics(stats)
-            
-            # Format output
-            base_name = os.path.splitext(os.path.basename(file_path))[0]
+            cleaning_options = _cleaning_options(clean_text, remove_urls, remove_extra_spaces, lowercase)
+            result = _prepare_file(file_path, output_format, cleaning_options)
+            if result["output_name"] is None:
+                return result["status"], "", None, result["stats"]
             
-            if output_format == "JSON":
-                output_path = os.path.join(self.output_dir, f"{base_name}_converted.json")
-                json_output = self.formatter.to_json(extracted_data)
-                
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(json_output)
-                
-                preview = json_output[:2000] + "..." if len(json_output) > 2000 else json_output
-                
-            elif output_format == "CSV":
-                output_path = os.path.join(self.output_dir, f"{base_name}_converted.csv")
-                
-                # Extract tabular data for CSV
-                csv_data = self._extract_tabular_data(extracted_data)
-                if csv_data:
-                    self.formatter.to_csv(csv_data, output_path)
-                    preview = f"CSV file created with {len(csv_data)} rows"
-                else:
-                    return "No tabular data found for CSV export", "", None, stats_text
-                
-            elif output_format == "XML":
-                output_path = os.path.join(self.output_dir, f"{base_name}_converted.xml")
-                xml_output = self.formatter.to_xml(extracted_data)
-                
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(xml_output)
-                
-                preview = xml_output[:2000] + "..." if len(xml_output) > 2000 else xml_output
-            
-            elif output_format == "AI Training Format":
-                output_path = os.path.join(self.output_dir, f"{base_name}_ai_training.json")
-                ai_format = self.formatter.create_ai_training_format(extracted_data)
-                json_output = self.formatter.to_json(ai_format)
-                
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(json_output)
-                
-                preview = json_output[:2000] + "..." if len(json_output) > 2000 else json_output
-            
-            # Load data into chatbot for querying
-            data_format = output_format.lower().replace(" ", "_")
-            if output_format == "JSON" or output_format == "AI Training Format":
-                self.last_converted_data = json_output
-                self.chatbot.load_data(json_output, data_format)
-            elif output_format == "XML":
-                self.last_converted_data = xml_output
-                self.chatbot.load_data(xml_output, data_format)
-            elif output_format == "CSV" and csv_data:
-                # For CSV, convert back to string for chatbot
-                import io
-                csv_string = io.StringIO()
-                import csv
-                writer = csv.DictWriter(csv_string, fieldnames=csv_data[0].keys() if csv_data else [])
-                writer.writeheader()
-                writer.writerows(csv_data)
-                csv_content = csv_string.getvalue()
-                self.last_converted_data = csv_content
-                self.chatbot.load_data(csv_content, data_format)
-            
-            success_msg = f"Successfully processed: {os.path.basename(file_path)}\nOutput saved to: {output_path}"
-            
-            return success_msg, preview, output_path, stats_text
+            output_path = str(self.output_dir / result["output_name"])
+            _write_document(result.pop("document"), output_format, output_path)
             
+            # The chatbot only ever sees the head of the data, so read back just that
+            chat_data, _ = _read_head(output_path, DataChatbot.MAX_CONTEXT_CHARS)
+            preview = result["preview"]
+            if not preview:
+                preview, truncated = _read_head(output_path, PREVIEW_CHARS)
+                if truncated:
+                    preview += "..."
         except Exception as e:
             return f"Error processing file: {str(e)}", "", None, ""
+        
+        # Load data into chatbot for querying
+        data_format = output_format.lower().replace(" ", "_")
+        self.last_converted_data = chat_data
+        self.chatbot.load_data(chat_data, data_format)
+        
+        success_msg = f"Successfully processed: {pathlib.Path(file_path).name}\nOutput saved to: {output_path}"
+        
+        return success_msg, preview, output_path, result["stats"]
     
-    def _extract_tabular_data(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract tabular data from extracted content"""
-        if "data" in data:
-            return data["data"]
-        elif "all_data" in data:
-            return data["all_data"]
-        elif "tables" in data and data["tables"]:
-            # Convert first table to list of dicts
-            first_table = data["tables"][0]["data"]
-            if first_table and len(first_table) > 1:
-                headers = first_table[0]
-                rows = first_table[1:]
-                return [dict(zip(headers, row)) for row in rows]
-        return []
-    
-    def _format_statistics(self, stats: Dict[str, Any]) -> str:
-        """Format statistics for display"""
-        output = "**Document Statistics**\n\n"
+    def _run_pipeline(
+        self,
+        file_paths: List[str],
+        output_format: str,
+        cleaning_options: Optional[Dict[str, bool]],
+        zip_file: zipfile.ZipFile,
+        save_files: bool = False
+    ) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """
+        Convert files through a load -> parse -> write pipeline
+        
+        One loader validates files in upload order, parser workers build the
+        output payloads in memory and an async writer adds them to zip_file
+        (and to the output folder if save_files is set), connected by bounded
+        queues so reading, parsing and writing overlap.
+        The stages run on a background thread so results can be yielded as
+        soon as each file finishes.
+        
+        Yields:
+            (file_name, status_message, output_name) in completion order;
+            output_name is None for files that failed
+        """
+        workers = _max_workers()
+        writers = min(4, workers)
+        parse_queue = queue.Queue(maxsize=2 * workers)
+        write_queue = queue.Queue(maxsize=2 * workers)
+        results = queue.Queue()
+        failures = []
         
-        for key, value in stats.items():
-            formatted_key = key.replace('_', ' ').title()
-            output += f"**{formatted_key}:** {value}\n"
+        def record(file_name: str, status: str, output_path: Optional[str]):
+            results.put((file_name, status, output_path))
+        
+        def load():
+            try:
+                for file_path in file_paths:
+                    path = pathlib.Path(file_path)
+                    ext = path.suffix.lower()
+                    try:
+                        is_valid, validation_msg = FileValidator.validate_file(file_path, ext)
+                    except Exception as e:
+                        is_valid, validation_msg = False, f"Error validating file: {str(e)}"
+                    if is_valid:
+                        parse_queue.put((file_path, path.name, ext))
+                    else:
+                        record(path.name, validation_msg, None)
+            finally:
+                # Parsers block on the queue until they see their sentinel
+                for _ in range(workers):
+                    parse_queue.put(None)
+        
+        def parse(process_pool: ProcessPoolExecutor):
+            while True:
+                item = parse_queue.get()
+                if item is None:
+                    return
+                
+                file_path, file_name, ext = item
+                job = (file_path, output_format, cleaning_options)
+                try:
+                    # PDF/Word/Excel parsing holds the GIL, so those go to separate processes
+                    if ext in THREAD_FRIENDLY_EXTENSIONS:
+                        rendered = _render_one(job)
+                    else:
+                        rendered = process_pool.submit(_render_one, job).result()
+                except Exception as e:
+                    record(file_name, f"Error processing file: {str(e)}", None)
+                    continue
+                
+                if rendered["output_name"] is None:
+                    record(file_name, rendered["status"], None)
+                else:
+                    write_queue.put((file_name, rendered["output_name"], rendered["payload"]))
         
-        return output
+        def run():
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_WORKER_CONTEXT,
+                                         initializer=_init_batch_worker,
+                                         initargs=(dict(CONVERTERS),)) as process_pool, \
+                        ThreadPoolExecutor(max_workers=1) as loader_pool, \
+                        ThreadPoolExecutor(max_workers=workers) as parser_pool, \
+                        ThreadPoolExecutor(max_workers=1) as writer_pool:
+                    loader = loader_pool.submit(load)
+                    parsers = [parser_pool.submit(parse, process_pool) for _ in range(workers)]
+                    # Writes are pure I/O, so one event loop overlaps them instead of a thread each
+                    writer = writer_pool.submit(
+                        asyncio.run,
+                        _write_outputs(
+                            write_queue,
+                            zip_file,
+                            self.output_dir if save_files else None,
+                            record,
+                            writers
+                        )
+                    )
+                    
+                    try:
+                        loader.result()
+                        for parser in parsers:
+                            parser.result()
+                    finally:
+                        # The writer must always be released, or shutdown waits on it forever
+                        write_queue.put(None)
+                    writer.result()
+            except Exception as e:
+                failures.append(e)
+            finally:
+                results.put(None)
+        
+        coordinator = threading.Thread(target=run, daemon=True)
+        coordinator.start()
+        
+        while True:
+            result = results.get()
+            if result is None:
+                break
+            yield result
+        
+        coordinator.join()
+        if failures:
+            raise failures[0]
     
     def process_batch(
         self,
@@ -201,50 +647,62 @@ class AIDataConverter:
         clean_text: bool,
         remove_urls: bool,
         remove_extra_spaces: bool,
-        lowercase: bool
-    ) -> Tuple[str, str]:
-        """Process multiple files in batch"""
+        lowercase: bool,
+        save_files: bool = False
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Process multiple files in batch
+        
+        Outputs are written straight into the batch ZIP; save_files also keeps
+        a copy of each one in the output folder. Yields a running summary after
+        each file so the UI updates while the batch runs; the last yield
+        carries the final summary and ZIP path.
+        """
         if not files:
-            return "No files uploaded", ""
+            yield "No files uploaded", None
+            return
+        
+        cleaning_options = _cleaning_options(clean_text, remove_urls, remove_extra_spaces, lowercase)
+        # Group files of the same type and go small-first: the same backend stays
+        # hot, the loader reads in a stable order and early results arrive sooner
+        file_paths = sorted((file_obj.name for file_obj in files), key=_batch_sort_key)
         
         results = []
         successful = 0
         failed = 0
         
-        for file_obj in files:
-            file_path = file_obj.name
-            status, _, output_path, _ = self.process_file(
-                file_path,
-                output_format,
-                clean_text,
-                remove_urls,
-                remove_extra_spaces,
-                lowercase
-            )
-            
-            if output_path:
-                successful += 1
-                results.append(f"[OK] {os.path.basename(file_path)}")
-            else:
-                failed += 1
-                results.append(f"[FAILED] {os.path.basename(file_path)}: {status}")
+        # Each batch gets its own archive so concurrent batches don't clobber one another
+        zip_fd, zip_name = tempfile.mkstemp(prefix="batch_output_", suffix=".zip", dir=self.output_dir)
+        os.close(zip_fd)
+        zip_path = pathlib.Path(zip_name)
+        # Level 1 trades a little size for much less CPU
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+            pipeline = self._run_pipeline(file_paths, output_format, cleaning_options, zip_file, save_files)
+            for file_name, status, output_name in pipeline:
+                if output_name:
+                    successful += 1
+                    results.append(f"[OK] {file_name}")
+                else:
+                    failed += 1
+                    results.append(f"[FAILED] {file_name}: {status}")
+                
+                progress = f"**Processing Batch** ({len(results)}/{len(file_paths)})\n\n"
+                progress += f"Successful: {successful}\n"
+                progress += f"Failed: {failed}\n\n"
+                progress += "**Details:**\n" + "\n".join(results)
+                yield progress, None
         
         summary = f"**Batch Processing Complete**\n\n"
         summary += f"Successful: {successful}\n"
         summary += f"Failed: {failed}\n\n"
         summary += "**Details:**\n" + "\n".join(results)
         
-        # Create a zip file with all outputs
         if successful > 0:
-            zip_path = os.path.join(self.output_dir, "batch_output.zip")
-            shutil.make_archive(
-                os.path.join(self.output_dir, "batch_output"),
-                'zip',
-                self.output_dir
-            )
-            return summary, zip_path
+            yield summary, str(zip_path)
+            return
         
-        return summary, None
+        zip_path.unlink()
+        yield summary, None
     
     def chat_with_data(self, message: str, history: list) -> Tuple[str, list]:
         """
@@ -544,7 +1002,7 @@ def create_interface():
                         )
                         
                         output_format = gr.Radio(
-                            choices=["JSON", "CSV", "XML", "AI Training Format"],
+                            choices=["JSON", "CSV", "XML", "AI Training Format", "AI Training Format (JSONL)"],
                             value="JSON",
                             label="Output Format"
                         )
@@ -602,7 +1060,7 @@ def create_interface():
                         )
                         
                         batch_output_format = gr.Radio(
-                            choices=["JSON", "CSV", "XML", "AI Training Format"],
+                            choices=["JSON", "CSV", "XML", "AI Training Format", "AI Training Format (JSONL)"],
                             value="JSON",
                             label="Output Format"
                         )
@@ -613,6 +1071,11 @@ def create_interface():
                             batch_remove_spaces = gr.Checkbox(label="Remove Extra Spaces", value=True)
                             batch_lowercase = gr.Checkbox(label="Convert to Lowercase", value=False)
                         
+                        batch_save_files = gr.Checkbox(
+                            label="Also save individual files to the output folder",
+                            value=False
+                        )
+                        
                         batch_process_btn = gr.Button("Process Batch", variant="primary")
                     
                     with gr. Column():
@@ -627,7 +1090,8 @@ def create_interface():
                         batch_clean,
                         batch_remove_urls,
                         batch_remove_spaces,
-                        batch_lowercase
+                        batch_lowercase,
+                        batch_save_files
                     ],
                     outputs=[batch_status, batch_download]
                 )
@@ -740,9 +1204,12 @@ def create_interface():
                     **AI Training Format** - Special format that includes the text plus metadata. 
                     Useful if you're training language models or doing NLP.
                     
+                    **AI Training Format (JSONL)** - One record per line (page, paragraph, text line or table row).
+                    This is what most training pipelines expect, and it can be read a line at a time.
+                    
                     ### What powers this
                     
-                    Built with Python using PyMuPDF and pdfplumber for PDFs, python-docx for Word files,
+                    Built with Python using PyMuPDF for PDF text and tables, python-docx for Word files,
                     and pandas for Excel. The interface is Gradio.
                     
                     All processing happens on your computer - nothing gets sent to external servers.
@@ -14,6 +14,9 @@ load_dotenv()
 class DataChatbot:
     """Chatbot that can answer questions about converted data using Groq API"""
     
+    # Only this much of the loaded data is sent as context
+    MAX_CONTEXT_CHARS = 4000
+    
     def __init__(self):
         """Initialize the chatbot with Groq API"""
         api_key = os.getenv("GROQ_API_KEY")
@@ -58,7 +61,7 @@ class DataChatbot:
 The user has converted a document into the following data format ({self.data_context['format']}):
 
 ```
-{self.data_context['content'][:4000]}  # Limit context to avoid token limits
+{self.data_context['content'][:self.MAX_CONTEXT_CHARS]}  # Limit context to avoid token limits
 ```
 
 Answer the user's questions based on this data. Be specific and reference actual values from the data.
@@ -1,9 +1,34 @@
 """
 File converter modules for AI Data Conversion Tool
 """
-from .pdf_converter import PDFConverter
-from .word_converter import WordConverter
-from .excel_converter import ExcelConverter
-from .text_converter import TextConverter
+import importlib
 
-__all__ = ['PDFConverter', 'WordConverter', 'ExcelConverter', 'TextConverter']
+__all__ = ['PDFConverter', 'WordConverter', 'ExcelConverter', 'TextConverter', 'CONVERTER_REGISTRY']
+
+# Converters are imported on first access so that using one of them does not
+# pull in every backend (PyMuPDF, python-docx, pandas, ...)
+_CONVERTER_MODULES = {
+    'PDFConverter': '.pdf_converter',
+    'WordConverter': '.word_converter',
+    'ExcelConverter': '.excel_converter',
+    'TextConverter': '.text_converter'
+}
+
+# Converter for each supported extension (lower-case, without the dot). Names
+# are resolved through __getattr__, so only the backend in use gets imported
+CONVERTER_REGISTRY = {
+    'pdf': 'PDFConverter',
+    'docx': 'WordConverter',
+    'doc': 'WordConverter',
+    'xlsx': 'ExcelConverter',
+    'xls': 'ExcelConverter',
+    'txt': 'TextConverter',
+    'csv': 'TextConverter'
+}
+
+
+def __getattr__(name):
+    if name in _CONVERTER_MODULES:
+        module = importlib.import_module(_CONVERTER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
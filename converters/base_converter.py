@@ -2,17 +2,170 @@
 Base converter class that all file converters inherit from
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, BinaryIO, Optional
+import functools
+import hashlib
+import io
+import json
+import mmap
 import os
+import pathlib
+import pickle
+import tempfile
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+# Extraction results can be cached on disk by file content. The cache keeps
+# the full extracted text of every file, so it is off unless
+# DOC_CONVERTER_CACHE_DIR names a directory (e.g. ~/.cache/doc-converter)
+CACHE_DIR = os.getenv("DOC_CONVERTER_CACHE_DIR", "")
+# Bump when converter output changes so stale entries are ignored
+CACHE_VERSION = 2
+HASH_CHUNK_SIZE = 1 << 20
+
+# Texts at least this long are word-counted with NumPy instead of str.split
+VECTOR_COUNT_MIN_CHARS = 64 * 1024
+
+
+def count_words(text: str) -> int:
+    """
+    Count whitespace-separated words, same result as len(text.split())
+    
+    Long ASCII texts are scanned as bytes with NumPy (a word starts wherever
+    a non-space byte follows a space), so no per-word strings are created.
+    Other texts fall back to str.split, which knows every Unicode space.
+    """
+    if len(text) < VECTOR_COUNT_MIN_CHARS or not text.isascii():
+        return len(text.split())
+    
+    import numpy as np
+    
+    buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    # The ASCII characters str.split treats as whitespace: \t-\r, \x1c-\x1f and space
+    is_space = (buf == 32) | ((buf >= 9) & (buf <= 13)) | ((buf >= 28) & (buf <= 31))
+    return int(np.count_nonzero(is_space[:-1] & ~is_space[1:])) + int(not is_space[0])
+
+
+def json_bytes(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes, using orjson when available
+    
+    orjson writes numpy scalars and arrays natively and anything else unknown
+    (dtypes, timestamps) via str, matching the stdlib fallback's default=str.
+    """
+    if orjson is None:
+        return json.dumps(data, indent=2 if pretty else None, ensure_ascii=False, default=str).encode('utf-8')
+    
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=str, option=option)
+
+
+def cached_extract(extract):
+    """
+    Serve extract() from the on-disk cache when the same content was seen before
+    
+    Failed extractions are not cached, and any cache problem falls back to a
+    normal extract.
+    """
+    @functools.wraps(extract)
+    def wrapper(self) -> Dict[str, Any]:
+        if not CACHE_DIR:
+            return extract(self)
+        
+        try:
+            cache_path = pathlib.Path(CACHE_DIR).expanduser() / f"{self._cache_key()}.pkl"
+        except OSError:
+            return extract(self)
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass
+        
+        result = extract(self)
+        if "error" not in result:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temp file first so readers never see a partial entry
+                fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                pass
+        return result
+    
+    return wrapper
+
+
+class MappedFile(io.RawIOBase):
+    """
+    Read-only, seekable file object over a memory-mapped file
+    
+    mmap objects only gained seekable() in Python 3.13, and zip-based
+    backends (python-docx, openpyxl) refuse streams without it.
+    """
+    
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        data = self._mapped.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._mapped.seek(offset, whence)
+        return self._mapped.tell()
+    
+    def tell(self) -> int:
+        return self._mapped.tell()
+    
+    def __len__(self) -> int:
+        return len(self._mapped)
 
 
 class BaseConverter(ABC):
     """Abstract base class for all file converters"""
     
-    def __init__(self, file_path: str):
+    # Converters whose backends can read from an open binary buffer set this
+    supports_stream = False
+    
+    def __init__(self, file_path: Optional[str] = None, stream: Optional[BinaryIO] = None):
+        self.file_path = None
+        self.file_name = None
+        self.ext = ""
+        self.file_size = 0
+        self.file_mtime_ns = 0
+        self.stream = None
+        self._metadata = None
+        if file_path is not None:
+            self.load(file_path, stream)
+    
+    def load(self, file_path: str, stream: Optional[BinaryIO] = None):
+        """Point the converter at a new file so one instance can be reused across a batch"""
         self.file_path = file_path
         self.file_name = os.path.basename(file_path)
-        self.file_size = os.path.getsize(file_path)
+        # Lower-case extension without the dot, for converters that branch on type
+        self.ext = os.path.splitext(file_path)[1].lower().lstrip('.')
+        stat = os.stat(file_path)
+        self.file_size = stat.st_size
+        self.file_mtime_ns = stat.st_mtime_ns
+        self.stream = stream
+        # Subclasses that read metadata from the document cache it here per file
+        self._metadata = None
         
     @abstractmethod
     def extract(self) -> Dict[str, Any]:
@@ -24,6 +177,46 @@ class BaseConverter(ABC):
         """Get file metadata"""
         pass
     
+    def _cache_params(self) -> tuple:
+        """Converter options that change extract() output; part of the cache key"""
+        return ()
+    
+    def _cache_key(self) -> str:
+        """Hash of the file content, size, type and converter options"""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(repr((
+            CACHE_VERSION,
+            type(self).__name__,
+            self.ext,
+            self.file_size,
+            self._cache_params()
+        )).encode())
+        # Hash the whole file: it is far cheaper than parsing, and a prefix would
+        # miss edits further in that keep the size unchanged
+        with open(self.file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _source(self):
+        """Return the open stream (rewound) if one was given, otherwise the file path"""
+        if self.stream is None:
+            return self.file_path
+        self.stream.seek(0)
+        return self.stream
+    
+    def to_json(self, data: Optional[Dict[str, Any]] = None, pretty: bool = False) -> bytes:
+        """
+        Serialize an extract() result to UTF-8 JSON bytes
+        
+        Extracts first when no result is given. Numpy values and other
+        unknown types are encoded by json_bytes, so converters can leave
+        them unconverted.
+        """
+        if data is None:
+            data = self.extract()
+        return json_bytes(data, pretty)
+    
     def get_file_info(self) -> Dict[str, Any]:
         """Get basic file information"""
         return {
@@ -2,28 +2,72 @@
 Excel spreadsheet converter
 """
 import pandas as pd
-from typing import Dict, Any, List
-from .base_converter import BaseConverter
+from typing import Dict, Any, List, BinaryIO, Optional
+from .base_converter import BaseConverter, cached_extract
+
+# python-calamine parses workbooks in Rust without building openpyxl's XML tree
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None  # let pandas pick openpyxl/xlrd
 
 
 class ExcelConverter(BaseConverter):
     """Convert Excel files to structured data"""
     
-    def __init__(self, file_path: str):
-        super().__init__(file_path)
+    supports_stream = True
+    
+    RECORD_FORMATS = ("records", "columns")
+    
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        stream: Optional[BinaryIO] = None,
+        dtype_hints: Optional[Dict[str, Any]] = None,
+        record_format: str = "records",
+        compute_stats: bool = False
+    ):
+        """
+        Args:
+            file_path: Path to the spreadsheet
+            stream: Optional binary stream over the same file
+            dtype_hints: Column -> dtype map passed to pandas so it can skip
+                type inference for known columns
+            record_format: "records" for a list of row dicts, or "columns" for
+                one {column: [values]} dict, which needs one list per column
+                instead of one dict per row
+            compute_stats: Add per-sheet statistics (null counts, dtypes,
+                numeric summary), which costs extra passes over every column
+        """
+        if record_format not in self.RECORD_FORMATS:
+            raise ValueError(f"record_format must be one of {self.RECORD_FORMATS}")
+        self.dtype_hints = dtype_hints
+        self.record_format = record_format
+        self.compute_stats = compute_stats
+        super().__init__(file_path, stream)
         
+    @cached_extract
     def extract(self) -> Dict[str, Any]:
         """Extract data from Excel spreadsheet"""
         try:
-            # Read all sheets
-            excel_file = pd.ExcelFile(self.file_path)
+            # Open the workbook once and read every sheet from the same handle
+            excel_file = self._open_workbook()
             sheet_names = excel_file.sheet_names
             
             sheets_data = []
             all_data = []
+            columnar = self.record_format == "columns"
             
             for sheet_name in sheet_names:
-                df = pd.read_excel(self.file_path, sheet_name=sheet_name)
+                df = pd.read_excel(excel_file, sheet_name=sheet_name, dtype=self.dtype_hints)
+                if columnar:
+                    records = {column: df[column].tolist() for column in df.columns}
+                    preview = df.head(10).to_dict('records')
+                else:
+                    # Build the row dicts once; preview and all_data share them
+                    records = df.to_dict('records')
+                    preview = records[:10]
                 
                 # Convert DataFrame to structured format
                 sheet_data = {
@@ -31,13 +75,18 @@ class ExcelConverter(BaseConverter):
                     "rows": len(df),
                     "columns": len(df.columns),
                     "column_names": df.columns.tolist(),
-                    "data": df.to_dict('records'),
-                    "preview": df.head(10).to_dict('records'),
-                    "statistics": self._get_statistics(df)
+                    "data": records,
+                    "preview": preview
                 }
+                if self.compute_stats:
+                    sheet_data["statistics"] = self._get_statistics(df)
                 
                 sheets_data.append(sheet_data)
-                all_data.extend(df.to_dict('records'))
+                if not columnar:
+                    all_data.extend(records)
+            
+            if columnar:
+                all_data = self._merge_columns(sheets_data)
             
             result = {
                 "document_type": "Excel Spreadsheet",
@@ -56,19 +105,54 @@ class ExcelConverter(BaseConverter):
                 "document_type": "Excel Spreadsheet"
             }
     
+    def _cache_params(self) -> tuple:
+        """dtype hints change the parsed values, the other options the output"""
+        return (
+            sorted(self.dtype_hints.items(), key=repr) if self.dtype_hints else None,
+            self.record_format,
+            self.compute_stats
+        )
+    
+    @staticmethod
+    def _merge_columns(sheets_data: List[Dict[str, Any]]) -> Dict[Any, List[Any]]:
+        """Stack columnar sheets, padding columns a sheet lacks with None"""
+        merged = {}
+        total_rows = 0
+        
+        for sheet_data in sheets_data:
+            for column, values in sheet_data["data"].items():
+                merged.setdefault(column, [None] * total_rows).extend(values)
+            total_rows += sheet_data["rows"]
+            for values in merged.values():
+                if len(values) < total_rows:
+                    values.extend([None] * (total_rows - len(values)))
+        
+        return merged
+    
+    def _open_workbook(self) -> pd.ExcelFile:
+        """Open the workbook with the fastest engine pandas supports"""
+        if EXCEL_ENGINE is not None:
+            try:
+                return pd.ExcelFile(self._source(), engine=EXCEL_ENGINE)
+            except ValueError:
+                pass  # pandas < 2.2 has no calamine engine
+        
+        return pd.ExcelFile(self._source())
+    
     def _get_statistics(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Get basic statistics for the DataFrame"""
         stats = {
             "total_rows": len(df),
             "total_columns": len(df.columns),
-            "null_values": df.isnull().sum().to_dict(),
-            "data_types": df.dtypes.astype(str).to_dict()
+            "null_values": {column: int(df[column].isna().sum()) for column in df.columns},
+            # dtype objects serialize as their names (JSON encoders fall back to str)
+            "data_types": df.dtypes.to_dict()
         }
         
-        # Add numeric statistics if available
+        # Add numeric statistics if available (no percentiles, which need a sort)
         numeric_cols = df.select_dtypes(include=['number']).columns
         if len(numeric_cols) > 0:
-            stats["numeric_summary"] = df[numeric_cols].describe().to_dict()
+            stats["numeric_summary"] = df[numeric_cols].agg(['count', 'mean', 'std', 'min', 'max']).to_dict()
         
         return stats
     
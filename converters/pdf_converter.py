@@ -1,54 +1,73 @@
 """
-PDF file converter with multiple extraction methods
+PDF file converter (PyMuPDF for text and tables)
 """
 import fitz  # PyMuPDF
-import pdfplumber
-from typing import Dict, Any, List
-from .base_converter import BaseConverter
+from typing import Dict, Any, List, BinaryIO, Optional, Tuple
+from .base_converter import BaseConverter, cached_extract
+
+
+def _extract_page(page: "fitz.Page", page_num: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Extract the text, word count and tables of one open page"""
+    text = page.get_text()
+    page_data = {
+        "page_number": page_num + 1,
+        "text": text,
+        "word_count": len(text.split())
+    }
+    return page_data, PDFConverter._page_tables(page, page_num)
 
 
 class PDFConverter(BaseConverter):
     """Convert PDF files to structured data"""
     
-    def __init__(self, file_path: str):
-        super().__init__(file_path)
+    def __init__(self, file_path: Optional[str] = None, stream: Optional[BinaryIO] = None):
+        self.doc = None
+        super().__init__(file_path, stream)
+    
+    def load(self, file_path: str, stream: Optional[BinaryIO] = None):
+        """Point the converter at a new file, dropping the previous document"""
+        super().load(file_path, stream)
         self.doc = None
         
+    @cached_extract
     def extract(self) -> Dict[str, Any]:
-        """Extract text and tables from PDF"""
+        """Extract text, tables and counts from PDF in a single page walk"""
         try:
-            # Use PyMuPDF for text extraction
+            # MuPDF reads the path natively, no Python-side copy
             self.doc = fitz.open(self.file_path)
+            # Read metadata from this open rather than reopening for get_metadata()
+            self._metadata = self._collect_metadata(self.doc)
+            # Batch workers already spread files across processes, so pages are read in order
+            page_results = [_extract_page(page, page_num) for page_num, page in enumerate(self.doc)]
             
             pages_data = []
             full_text = []
+            tables = []
+            total_words = 0
+            total_characters = 0
             
-            for page_num in range(len(self.doc)):
-                page = self.doc[page_num]
-                text = page.get_text()
-                
-                page_data = {
-                    "page_number": page_num + 1,
-                    "text": text,
-                    "word_count": len(text.split())
-                }
-                
+            for page_data, page_tables in page_results:
                 pages_data.append(page_data)
-                full_text.append(text)
+                full_text.append(page_data["text"])
+                tables.extend(page_tables)
+                total_words += page_data["word_count"]
+                total_characters += len(page_data["text"])
             
-            # Extract tables using pdfplumber
-            tables = self._extract_tables()
+            # Account for the blank line joining consecutive pages
+            if full_text:
+                total_characters += 2 * (len(full_text) - 1)
             
             result = {
                 "document_type": "PDF",
                 "total_pages": len(self.doc),
                 "full_text": "\n\n".join(full_text),
+                "total_words": total_words,
+                "total_characters": total_characters,
                 "pages": pages_data,
                 "tables": tables,
-                "metadata": self.get_metadata()
+                "metadata": self._metadata
             }
             
-            self.doc.close()
             return result
             
         except Exception as e:
@@ -56,37 +75,59 @@ class PDFConverter(BaseConverter):
                 "error": f"Failed to extract PDF: {str(e)}",
                 "document_type": "PDF"
             }
+        finally:
+            self.close()
+    
+    def close(self):
+        """Close the open PyMuPDF document, if any"""
+        if self.doc is not None and not self.doc.is_closed:
+            self.doc.close()
     
-    def _extract_tables(self) -> List[Dict[str, Any]]:
-        """Extract tables from PDF using pdfplumber"""
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @staticmethod
+    def _page_tables(page, page_num: int) -> List[Dict[str, Any]]:
+        """Extract tables from an already open PyMuPDF page"""
         tables_data = []
         
         try:
-            with pdfplumber.open(self.file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    tables = page.extract_tables()
-                    
-                    for table_idx, table in enumerate(tables):
-                        if table:
-                            table_data = {
-                                "page": page_num + 1,
-                                "table_index": table_idx + 1,
-                                "rows": len(table),
-                                "columns": len(table[0]) if table else 0,
-                                "data": table
-                            }
-                            tables_data.append(table_data)
+            # find_tables() builds its own TextPage (and may use layout
+            # analysis), so it cannot share the one behind page.get_text()
+            for table_idx, found in enumerate(page.find_tables().tables):
+                table = found.extract()
+                if table:
+                    tables_data.append({
+                        "page": page_num + 1,
+                        "table_index": table_idx + 1,
+                        "rows": len(table),
+                        "columns": len(table[0]) if table else 0,
+                        "data": table
+                    })
         except Exception as e:
             pass  # Tables extraction is optional
-            
+        
         return tables_data
     
     def get_metadata(self) -> Dict[str, Any]:
-        """Get PDF metadata"""
-        if not self.doc:
-            self.doc = fitz.open(self.file_path)
+        """Get PDF metadata, read once per file"""
+        if self._metadata is not None:
+            return self._metadata
         
-        metadata = self.doc.metadata
+        if self.doc is None or self.doc.is_closed:
+            with fitz.open(self.file_path) as doc:
+                self._metadata = self._collect_metadata(doc)
+        else:
+            self._metadata = self._collect_metadata(self.doc)
+        return self._metadata
+    
+    @staticmethod
+    def _collect_metadata(doc: "fitz.Document") -> Dict[str, Any]:
+        """Build the metadata dict from an open document"""
+        metadata = doc.metadata
         
         return {
             "title": metadata.get("title", "N/A"),
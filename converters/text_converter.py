@@ -2,37 +2,88 @@
 Text file converter (TXT, CSV, etc.)
 """
 import csv
-import chardet
-from typing import Dict, Any
-from .base_converter import BaseConverter
+import itertools
+try:
+    import cchardet as chardet  # C implementation, same API
+except ImportError:
+    import chardet
+from typing import Dict, Any, BinaryIO, Iterator, List, Optional
+from .base_converter import BaseConverter, count_words
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; csv.DictReader is the fallback
+    pa = None
+    pacsv = None
+
+# Encoding detection feeds the file in chunks and stops once chardet is
+# confident or this much has been read
+DETECT_CHUNK_SIZE = 64 * 1024
+DETECT_MAX_BYTES = 1024 * 1024
+
+# Plain text results keep at most this many per-line entries; get_lines()
+# reads further into the file on demand
+MAX_LINES = 10_000
 
 
 class TextConverter(BaseConverter):
     """Convert text files to structured data"""
     
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        max_lines: Optional[int] = MAX_LINES,
+        full_data: bool = True
+    ):
+        """
+        Args:
+            file_path: Path to the text or CSV file
+            max_lines: Cap on per-line entries kept for plain text (None for all)
+            full_data: Keep every CSV row; False only counts rows and keeps the
+                preview, in constant memory
+        """
+        self.encoding = 'utf-8'
+        self.max_lines = max_lines
+        self.full_data = full_data
+        # Extractor per extension; anything else is read as plain text
+        self._handlers = {'csv': self._extract_csv}
         super().__init__(file_path)
+    
+    def load(self, file_path: str, stream: Optional[BinaryIO] = None):
+        """Point the converter at a new file and detect its encoding"""
+        super().load(file_path, stream)
         self.encoding = self._detect_encoding()
         
     def _detect_encoding(self) -> str:
-        """Detect file encoding"""
+        """Detect file encoding from a bounded prefix of the file"""
         try:
+            detector = chardet.UniversalDetector()
+            read = 0
             with open(self.file_path, 'rb') as file:
-                raw_data = file.read()
-                result = chardet.detect(raw_data)
-                return result['encoding'] or 'utf-8'
+                while read < DETECT_MAX_BYTES:
+                    chunk = file.read(DETECT_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    read += len(chunk)
+                    detector.feed(chunk)
+                    if detector.done:
+                        break
+            detector.close()
+            
+            encoding = detector.result['encoding'] or 'utf-8'
+            # An ASCII prefix says nothing about the rest of the file; UTF-8 decodes both
+            if encoding == 'ascii' and read < self.file_size:
+                return 'utf-8'
+            return encoding
         except:
             return 'utf-8'
     
     def extract(self) -> Dict[str, Any]:
         """Extract text content"""
         try:
-            # Check if it's a CSV file
-            if self.file_path.lower().endswith('.csv'):
-                return self._extract_csv()
-            else:
-                return self._extract_plain_text()
-                
+            return self._handlers.get(self.ext, self._extract_plain_text)()
+            
         except Exception as e:
             return {
                 "error": f"Failed to extract text file: {str(e)}",
@@ -40,34 +91,76 @@ class TextConverter(BaseConverter):
             }
     
     def _extract_plain_text(self) -> Dict[str, Any]:
-        """Extract plain text file"""
+        """Extract plain text file in a single pass over its lines"""
+        texts = []
+        lines = []
+        lines_truncated = False
+        total_characters = 0
+        ends_with_newline = True
+        
         with open(self.file_path, 'r', encoding=self.encoding) as file:
-            content = file.read()
-            lines = content.split('\n')
-            
-            result = {
-                "document_type": "Text File",
-                "encoding": self.encoding,
-                "total_lines": len(lines),
-                "total_characters": len(content),
-                "word_count": len(content.split()),
-                "full_text": content,
-                "lines": [{"line_number": i+1, "text": line} for i, line in enumerate(lines) if line.strip()],
-                "metadata": self.get_metadata()
-            }
-            
-            return result
+            for line_number, line in enumerate(file, 1):
+                total_characters += len(line)
+                ends_with_newline = line.endswith('\n')
+                text = line[:-1] if ends_with_newline else line
+                texts.append(text)
+                
+                if text and not text.isspace():
+                    if self.max_lines is None or len(lines) < self.max_lines:
+                        lines.append({"line_number": line_number, "text": text})
+                    else:
+                        lines_truncated = True
+        
+        # Splitting on '\n' yields a trailing empty line after a final newline
+        if ends_with_newline:
+            texts.append('')
+        
+        full_text = "\n".join(texts)
+        
+        result = {
+            "document_type": "Text File",
+            "encoding": self.encoding,
+            "total_lines": len(texts),
+            "total_characters": total_characters,
+            "word_count": count_words(full_text),
+            "full_text": full_text,
+            "lines": lines,
+            "metadata": self.get_metadata()
+        }
+        if lines_truncated:
+            result["lines_truncated"] = True
+        
+        return result
+    
+    @staticmethod
+    def iter_lines(file_path: str, encoding: str) -> Iterator[Dict[str, Any]]:
+        """Yield a {"line_number", "text"} entry for every non-blank line of a text file"""
+        with open(file_path, 'r', encoding=encoding) as file:
+            for line_number, line in enumerate(file, 1):
+                if line.strip():
+                    yield {"line_number": line_number, "text": line.rstrip('\n')}
+    
+    def get_lines(self, start: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return non-blank line entries, including those past max_lines
+        
+        Args:
+            start: Index of the first non-blank line to return
+            limit: Maximum number of entries (None for all remaining)
+        """
+        stop = None if limit is None else start + limit
+        return list(itertools.islice(self.iter_lines(self.file_path, self.encoding), start, stop))
     
     def _extract_csv(self) -> Dict[str, Any]:
         """Extract CSV file"""
-        rows = []
+        if not self.full_data:
+            return self._extract_csv_preview()
         
-        with open(self.file_path, 'r', encoding=self.encoding) as file:
-            csv_reader = csv.DictReader(file)
-            headers = csv_reader.fieldnames
-            
-            for row in csv_reader:
-                rows.append(row)
+        headers, rows = None, None
+        if pacsv is not None:
+            headers, rows = self._read_csv_arrow()
+        if rows is None:
+            headers, rows = self._read_csv_python()
         
         result = {
             "document_type": "CSV File",
@@ -82,6 +175,97 @@ class TextConverter(BaseConverter):
         
         return result
     
+    def _extract_csv_preview(self) -> Dict[str, Any]:
+        """Extract headers, the first rows and the row count without keeping the rows"""
+        with open(self.file_path, 'r', encoding=self.encoding) as file:
+            csv_reader = csv.DictReader(file)
+            headers = csv_reader.fieldnames
+            preview = list(itertools.islice(csv_reader, 10))
+        
+        return {
+            "document_type": "CSV File",
+            "encoding": self.encoding,
+            "total_rows": self._count_csv_rows(headers),
+            "total_columns": len(headers) if headers else 0,
+            "headers": headers,
+            "preview": preview,
+            "metadata": self.get_metadata()
+        }
+    
+    def _count_csv_rows(self, headers: Optional[List[str]]) -> int:
+        """
+        Count data rows as csv.DictReader would, streaming the file
+        
+        A raw newline count would be off for quoted line breaks and blank
+        lines, so rows are counted by a CSV parser: pyarrow's batch reader
+        when available, csv.reader otherwise.
+        """
+        if not headers:
+            return 0
+        
+        if pacsv is not None and len(set(headers)) == len(headers):
+            try:
+                reader = pacsv.open_csv(
+                    self.file_path,
+                    read_options=pacsv.ReadOptions(encoding=self.encoding),
+                    parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={name: pa.string() for name in headers}
+                    )
+                )
+                return sum(batch.num_rows for batch in reader)
+            except (pa.ArrowException, LookupError, UnicodeError):
+                pass
+        
+        with open(self.file_path, 'r', encoding=self.encoding, newline='') as file:
+            # Skip the header; DictReader ignores blank rows
+            return sum(1 for row in itertools.islice(csv.reader(file), 1, None) if row)
+    
+    def _read_csv_arrow(self):
+        """
+        Parse the CSV with pyarrow's multithreaded C++ reader
+        
+        Every column is read as a string so values match csv.DictReader
+        (no type inference, empty cells stay ""). Returns (None, None) for
+        files pyarrow rejects, e.g. ragged rows or codecs it can't decode.
+        """
+        headers = self._read_csv_header()
+        if not headers or len(set(headers)) != len(headers):
+            return None, None
+        
+        try:
+            table = pacsv.read_csv(
+                self.file_path,
+                read_options=pacsv.ReadOptions(use_threads=True, encoding=self.encoding),
+                # Quoted fields may contain line breaks, as csv.DictReader allows
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={name: pa.string() for name in headers}
+                )
+            )
+        except (pa.ArrowException, LookupError, UnicodeError):
+            return None, None
+        
+        return table.column_names, table.to_pylist()
+    
+    def _read_csv_header(self) -> Optional[List[str]]:
+        """Read only the header row"""
+        with open(self.file_path, 'r', encoding=self.encoding, newline='') as file:
+            return next(csv.reader(file), None)
+    
+    def _read_csv_python(self):
+        """Parse the CSV with csv.DictReader"""
+        rows = []
+        
+        with open(self.file_path, 'r', encoding=self.encoding) as file:
+            csv_reader = csv.DictReader(file)
+            headers = csv_reader.fieldnames
+            
+            for row in csv_reader:
+                rows.append(row)
+        
+        return headers, rows
+    
     def get_metadata(self) -> Dict[str, Any]:
         """Get text file metadata"""
         return {
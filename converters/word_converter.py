@@ -2,22 +2,35 @@
 Word document converter (DOCX format)
 """
 from docx import Document
-from typing import Dict, Any, List
-from .base_converter import BaseConverter
+from typing import Dict, Any, List, BinaryIO, Optional
+from .base_converter import BaseConverter, cached_extract
 import datetime
 
+# Table markup that makes the cell grid differ from the raw w:tr/w:tc structure
+# (spans, vertical merges, content controls); nested tables are left out
+# since they live inside cells and don't affect the outer grid
+LAYOUT_XPATH = './w:tr/w:tc/w:tcPr/w:gridSpan | ./w:tr/w:tc/w:tcPr/w:vMerge | ./w:sdt | ./w:tr/w:sdt'
+
 
 class WordConverter(BaseConverter):
     """Convert Word documents to structured data"""
     
-    def __init__(self, file_path: str):
-        super().__init__(file_path)
+    supports_stream = True
+    
+    def __init__(self, file_path: Optional[str] = None, stream: Optional[BinaryIO] = None):
+        self.doc = None
+        super().__init__(file_path, stream)
+    
+    def load(self, file_path: str, stream: Optional[BinaryIO] = None):
+        """Point the converter at a new file, dropping the previous document"""
+        super().load(file_path, stream)
         self.doc = None
         
+    @cached_extract
     def extract(self) -> Dict[str, Any]:
         """Extract text and structure from Word document"""
         try:
-            self.doc = Document(self.file_path)
+            self.doc = Document(self._source())
             
             paragraphs = []
             full_text = []
@@ -52,6 +65,9 @@ class WordConverter(BaseConverter):
                 "error": f"Failed to extract Word document: {str(e)}",
                 "document_type": "Word Document"
             }
+        finally:
+            # Reused converters would otherwise keep the whole document tree alive
+            self.doc = None
     
     def _extract_tables(self) -> List[Dict[str, Any]]:
         """Extract tables from Word document"""
@@ -59,11 +75,16 @@ class WordConverter(BaseConverter):
         
         try:
             for table_idx, table in enumerate(self.doc.tables):
-                rows_data = []
-                
-                for row in table.rows:
-                    row_data = [cell.text for cell in row.cells]
-                    rows_data.append(row_data)
+                tbl = table._element
+                if tbl.xpath(LAYOUT_XPATH):
+                    # Merged or content-controlled cells: let python-docx resolve the grid
+                    rows_data = [[cell.text for cell in row.cells] for row in table.rows]
+                else:
+                    # Plain grid: read cell paragraphs straight from the XML, no proxy objects
+                    rows_data = [
+                        ["\n".join(p.text for p in tc.xpath('./w:p')) for tc in tr.xpath('./w:tc')]
+                        for tr in tbl.xpath('./w:tr')
+                    ]
                 
                 table_data = {
                     "table_index": table_idx + 1,
@@ -78,13 +99,16 @@ class WordConverter(BaseConverter):
         return tables_data
     
     def get_metadata(self) -> Dict[str, Any]:
-        """Get Word document metadata"""
+        """Get Word document metadata, read once per file"""
+        if self._metadata is not None:
+            return self._metadata
+        
         if not self.doc:
-            self.doc = Document(self.file_path)
+            self.doc = Document(self._source())
         
         core_props = self.doc.core_properties
         
-        return {
+        self._metadata = {
             "title": core_props.title or "N/A",
             "author": core_props.author or "N/A",
             "subject": core_props.subject or "N/A",
@@ -93,3 +117,4 @@ class WordConverter(BaseConverter):
             "modified": str(core_props.modified) if core_props.modified else "N/A",
             "last_modified_by": core_props.last_modified_by or "N/A"
         }
+        return self._metadata
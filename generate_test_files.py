@@ -242,8 +242,14 @@ categories_data = {
 }
 df_categories = pd.DataFrame(categories_data)
 
-# Write to Excel with multiple sheets
-with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+# Write to Excel with multiple sheets; xlsxwriter is the faster writer, openpyxl the fallback
+try:
+    import xlsxwriter  # noqa: F401
+    excel_engine = 'xlsxwriter'
+except ImportError:
+    excel_engine = 'openpyxl'
+
+with pd.ExcelWriter(excel_file, engine=excel_engine) as writer:
     df_sales.to_excel(writer, sheet_name='Sales Data', index=False)
     df_summary.to_excel(writer, sheet_name='Summary', index=False)
     df_categories.to_excel(writer, sheet_name='Categories', index=False)
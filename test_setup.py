@@ -4,6 +4,8 @@ Quick test script to verify all converters are working
 import os
 import sys
 
+modules = sys.modules
+
 # Test imports
 print("=" * 60)
 print("Component Test")
@@ -13,25 +15,41 @@ print()
 def test_import(module_name, display_name):
     """Test if a module can be imported"""
     try:
-        __import__(module_name)
+        if module_name not in modules:
+            __import__(module_name)
         print(f"  [OK] {display_name:30}")
         return True
     except ImportError as e:
         print(f"  [FAIL] {display_name:30} {e}")
         return False
 
+def test_clean(text, options, expected, display_name):
+    """Test that DataCleaner.clean_text turns text into the expected result"""
+    try:
+        from utils.cleaner import DataCleaner
+        cleaned = DataCleaner.clean_text(text, options)
+    except Exception as e:
+        print(f"  [FAIL] {display_name:30} {e}")
+        return False
+    
+    if cleaned != expected:
+        print(f"  [FAIL] {display_name:30} got {cleaned!r}, expected {expected!r}")
+        return False
+    print(f"  [OK] {display_name:30}")
+    return True
+
 # Test core dependencies
 print("Testing Core Dependencies:")
 print("-" * 60)
 
+# Leaf dependencies first; gradio pulls most of them in again
 results = []
-results.append(test_import("gradio", "Gradio"))
-results.append(test_import("pandas", "Pandas"))
 results.append(test_import("numpy", "NumPy"))
+results.append(test_import("pandas", "Pandas"))
 results.append(test_import("fitz", "PyMuPDF"))
 results.append(test_import("docx", "python-docx"))
 results.append(test_import("openpyxl", "OpenPyXL"))
-results.append(test_import("pdfplumber", "pdfplumber"))
+results.append(test_import("gradio", "Gradio"))
 
 print()
 print("Testing Project Modules:")
@@ -46,6 +64,25 @@ results.append(test_import("utils.cleaner", "Data Cleaner"))
 results.append(test_import("utils.formatter", "Data Formatter"))
 results.append(test_import("utils.validator", "File Validator"))
 
+print()
+print("Testing Data Cleaning:")
+print("-" * 60)
+
+# Results must not depend on which regex engine (re, re2, hyperscan) is installed
+urls_only = {"remove_urls": True, "remove_extra_spaces": False}
+results.append(test_clean(
+    "Visit http://x.com/a\xa0today please", urls_only,
+    "Visit \xa0today please", "URL before no-break space"
+))
+results.append(test_clean(
+    "Read it here:https://medium.com/@jane/post today", {"remove_urls": True, "remove_emails": True},
+    "Read it here: today", "URL containing @"
+))
+results.append(test_clean(
+    "\u06635551234567 call", {"remove_phone_numbers": True, "remove_urls": False},
+    "\u06635551234567 call", "Digits after a non-ASCII digit"
+))
+
 print()
 print("=" * 60)
 
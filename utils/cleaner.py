@@ -2,72 +2,244 @@
 Data cleaning utility for removing noise and formatting text
 """
 import re
+import threading
+from functools import lru_cache
 from typing import List, Dict, Any
 
+try:
+    import hyperscan  # SIMD multi-pattern scanner for the noise-removal patterns
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2  # linear-time engine for the noise-removal patterns
+except ImportError:
+    re2 = None
+
+
+# The characters str.isspace() (and so re's \s) accepts, spelled out because
+# re2 and hyperscan only know ASCII whitespace for \s and \S
+_SPACE_CHARS = '\t\n\x0b\x0c\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+_NON_SPACE = f'[^{_SPACE_CHARS}]'
+
+# Patterns are compiled once at import instead of on every clean_text call
+_URL_PATTERN = f'https?://{_NON_SPACE}+'
+_EMAIL_PATTERN = f'{_NON_SPACE}+@{_NON_SPACE}+'
+_PHONE_PATTERN = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
+_SPECIAL_CHARS_PATTERN = r'[^a-zA-Z0-9\s]+'
+_NUMBERS_PATTERN = r'\d+'
+_PAGE_OF_RE = re.compile(r'Page \d+ of \d+$', re.IGNORECASE)
+
+# Cleaning options used when clean_text is called without them
+_DEFAULT_OPTS = {
+    'remove_extra_spaces': True,
+    'remove_special_chars': False,
+    'remove_numbers': False,
+    'lowercase': False,
+    'remove_urls': True,
+    'remove_emails': False,
+    'remove_phone_numbers': False
+}
+
+# ASCII texts at least this long are whitespace-normalized with a numba
+# kernel; below it the dispatch and encode/decode cost more than they save
+NUMBA_MIN_CHARS = 4 * 1024
+
+
+class _HyperscanPattern:
+    """Scan for every pattern at once and splice out the matched spans"""
+    
+    def __init__(self, patterns: List[str]):
+        self.pattern = '|'.join(f'(?:{pattern})' for pattern in patterns)
+        self.database = hyperscan.Database()
+        self.database.compile(
+            expressions=[pattern.encode() for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8] * len(patterns)
+        )
+        self._local = threading.local()
+    
+    def _scratch(self):
+        """Scratch space is per thread; parser threads clean concurrently"""
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self.database)
+        return scratch
+    
+    def sub(self, repl: str, text: str) -> str:
+        """Remove every match; the union of overlapping spans is dropped"""
+        data = text.encode('utf-8')
+        spans = []
+        self.database.scan(
+            data,
+            match_event_handler=lambda _id, start, end, _flags, _ctx: spans.append((start, end)),
+            scratch=self._scratch()
+        )
+        if not spans:
+            return text
+        
+        spans.sort()
+        parts = []
+        position = 0
+        for start, end in spans:
+            if start > position:
+                parts.append(data[position:start])
+            position = max(position, end)
+        parts.append(data[position:])
+        return repl.encode('utf-8').join(parts).decode('utf-8')
+
+
+def _compile_removal(parts: List[str]):
+    """Compile an alternation of deletion patterns with the fastest safe engine"""
+    pattern = '|'.join(f'(?:{part})' for part in parts)
+    compiled = re.compile(pattern)
+    
+    # Character-level deletions would mean one match callback per character
+    # under hyperscan, and neither hyperscan nor re2 has re's Unicode \b and
+    # \d, so special characters, numbers and phone numbers stay on re; the
+    # URL and email patterns give the same result on every engine
+    if any(part in (_PHONE_PATTERN, _SPECIAL_CHARS_PATTERN, _NUMBERS_PATTERN) for part in parts):
+        return compiled
+    if hyperscan is not None:
+        try:
+            return _HyperscanPattern(parts)
+        except Exception:
+            pass
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return compiled
+
+
+@lru_cache(maxsize=None)
+def _removal_passes(urls: bool, emails: bool, phones: bool,
+                    special_chars: bool = False, numbers: bool = False):
+    """
+    Compile the deletion passes for the enabled options
+    
+    URLs go first in a pass of their own, as removing them can leave a phone
+    number on a word boundary and "@" inside URLs would otherwise be taken
+    by the email pattern. The other deletions share one alternation, which
+    gives the same result as running them one after another.
+    """
+    rest = [
+        pattern for enabled, pattern in (
+            (emails, _EMAIL_PATTERN),
+            (phones, _PHONE_PATTERN),
+            (special_chars, _SPECIAL_CHARS_PATTERN),
+            (numbers, _NUMBERS_PATTERN),
+        ) if enabled
+    ]
+    
+    # \d{10} is already covered by the phone pattern with no separators
+    passes = []
+    if urls:
+        passes.append(_compile_removal([_URL_PATTERN]))
+    if rest:
+        passes.append(_compile_removal(rest))
+    return tuple(passes)
+
+
+@lru_cache(maxsize=None)
+def _compact_ws_kernel():
+    """Compile the whitespace compaction kernel on first use; None without numba"""
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    @numba.njit(cache=True)
+    def compact_ws(buf, out):
+        # Copy non-space runs joined by single spaces; the ASCII characters
+        # str.split treats as whitespace are \t-\r, \x1c-\x1f and space
+        length = 0
+        pending = False
+        for i in range(buf.shape[0]):
+            c = buf[i]
+            if c == 32 or 9 <= c <= 13 or 28 <= c <= 31:
+                pending = True
+            else:
+                if pending and length > 0:
+                    out[length] = 32
+                    length += 1
+                pending = False
+                out[length] = c
+                length += 1
+        return length
+    
+    return compact_ws
+
+
+def _normalize_whitespace(text: str) -> str:
+    """Normalize all whitespace to single spaces"""
+    if len(text) >= NUMBA_MIN_CHARS and text.isascii():
+        kernel = _compact_ws_kernel()
+        if kernel is not None:
+            import numpy as np
+            
+            buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+            out = np.empty_like(buf)
+            return out[:kernel(buf, out)].tobytes().decode('ascii')
+    return ' '.join(text.split())
+
+
+# Module-level so per-record callers skip the class attribute lookup;
+# DataCleaner exposes it as clean_text
+def _clean_text(text: str, options: Dict[str, bool] = None) -> str:
+    """
+    Clean text based on specified options
+    
+    Args:
+        text: Input text to clean
+        options: Dictionary of cleaning options
+            - remove_extra_spaces: Remove multiple spaces
+            - remove_special_chars: Remove special characters
+            - remove_numbers: Remove numeric characters
+            - lowercase: Convert to lowercase
+            - remove_urls: Remove URLs
+            - remove_emails: Remove email addresses
+            - remove_phone_numbers: Remove phone numbers
+    """
+    # Options left out fall back to the defaults
+    opts = _DEFAULT_OPTS if options is None else {**_DEFAULT_OPTS, **options}
+    if not any(opts.values()):
+        return text
+    
+    cleaned_text = text
+    
+    # Remove URLs, then emails, phone numbers, special characters and numbers
+    removal_passes = _removal_passes(
+        bool(opts['remove_urls']),
+        bool(opts['remove_emails']),
+        bool(opts['remove_phone_numbers']),
+        bool(opts['remove_special_chars']),
+        bool(opts['remove_numbers']),
+    )
+    for removal in removal_passes:
+        try:
+            cleaned_text = removal.sub('', cleaned_text)
+        except UnicodeEncodeError:  # lone surrogates; re2/hyperscan scan UTF-8
+            cleaned_text = re.sub(removal.pattern, '', cleaned_text)
+    
+    # Convert to lowercase
+    if opts['lowercase']:
+        cleaned_text = cleaned_text.lower()
+    
+    # Remove extra spaces (same result as collapsing \s+ and stripping)
+    if opts['remove_extra_spaces']:
+        cleaned_text = _normalize_whitespace(cleaned_text)
+    
+    return cleaned_text
+
 
 class DataCleaner:
     """Clean and preprocess extracted data"""
     
-    @staticmethod
-    def clean_text(text: str, options: Dict[str, bool] = None) -> str:
-        """
-        Clean text based on specified options
-        
-        Args:
-            text: Input text to clean
-            options: Dictionary of cleaning options
-                - remove_extra_spaces: Remove multiple spaces
-                - remove_special_chars: Remove special characters
-                - remove_numbers: Remove numeric characters
-                - lowercase: Convert to lowercase
-                - remove_urls: Remove URLs
-                - remove_emails: Remove email addresses
-                - remove_phone_numbers: Remove phone numbers
-        """
-        if options is None:
-            options = {
-                'remove_extra_spaces': True,
-                'remove_special_chars': False,
-                'remove_numbers': False,
-                'lowercase': False,
-                'remove_urls': True,
-                'remove_emails': False,
-                'remove_phone_numbers': False
-            }
-        
-        cleaned_text = text
-        
-        # Remove URLs
-        if options.get('remove_urls', True):
-            cleaned_text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', cleaned_text)
-        
-        # Remove email addresses
-        if options.get('remove_emails', False):
-            cleaned_text = re.sub(r'\S+@\S+', '', cleaned_text)
-        
-        # Remove phone numbers (basic pattern)
-        if options.get('remove_phone_numbers', False):
-            cleaned_text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '', cleaned_text)
-            cleaned_text = re.sub(r'\b\d{10}\b', '', cleaned_text)
-        
-        # Remove special characters
-        if options.get('remove_special_chars', False):
-            cleaned_text = re.sub(r'[^a-zA-Z0-9\s]', '', cleaned_text)
-        
-        # Remove numbers
-        if options.get('remove_numbers', False):
-            cleaned_text = re.sub(r'\d+', '', cleaned_text)
-        
-        # Convert to lowercase
-        if options.get('lowercase', False):
-            cleaned_text = cleaned_text.lower()
-        
-        # Remove extra spaces
-        if options.get('remove_extra_spaces', True):
-            cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
-            cleaned_text = cleaned_text.strip()
-        
-        return cleaned_text
+    clean_text = staticmethod(_clean_text)
+    normalize_whitespace = staticmethod(_normalize_whitespace)
     
     @staticmethod
     def remove_headers_footers(text: str) -> str:
@@ -76,12 +248,13 @@ class DataCleaner:
         cleaned_lines = []
         
         for line in lines:
-            # Skip common header/footer patterns
-            if re.match(r'^Page \d+ of \d+$', line.strip(), re.IGNORECASE):
+            # Skip common header/footer patterns, cheapest checks first
+            stripped = line.strip()
+            if len(stripped) < 3:  # Very short lines
                 continue
-            if re.match(r'^\d+$', line.strip()):  # Page numbers alone
+            if stripped.isdecimal():  # Page numbers alone
                 continue
-            if len(line.strip()) < 3:  # Very short lines
+            if _PAGE_OF_RE.match(stripped):
                 continue
             
             cleaned_lines.append(line)
@@ -97,7 +270,10 @@ class DataCleaner:
         for item in items:
             # Handle dictionaries
             if isinstance(item, dict):
-                item_key = str(sorted(item.items()))
+                try:
+                    item_key = frozenset(item.items())
+                except TypeError:  # unhashable values such as nested lists
+                    item_key = tuple(sorted((key, repr(value)) for key, value in item.items()))
             else:
                 item_key = item
             
@@ -107,11 +283,6 @@ class DataCleaner:
         
         return result
     
-    @staticmethod
-    def normalize_whitespace(text: str) -> str:
-        """Normalize all whitespace to single spaces"""
-        return ' '.join(text.split())
-    
     @staticmethod
     def remove_empty_entries(data: List[Dict]) -> List[Dict]:
         """Remove entries with all empty values"""
@@ -1,22 +1,95 @@
 """
 Data formatter for converting to various output formats
 """
-import json
 import csv
-from typing import Dict, Any, List
+import io
+from typing import Dict, Any, Iterable, Iterator, List
 import os
 
+from converters.base_converter import count_words, json_bytes
+
+# Indentation strings by nesting depth, built once instead of per element
+_INDENT = tuple("  " * depth for depth in range(32))
+
+# Characters replaced with underscores when dict keys become XML tag names
+_XML_KEY_TBL = str.maketrans({' ': '_', '-': '_'})
+
+
+def _json_cell(value: Any) -> str:
+    """Encode a nested dict/list as compact JSON text for a single CSV cell"""
+    return json_bytes(value).decode('utf-8')
+
+
+# Module-level so per-record and recursive calls skip the class attribute
+# lookup; DataFormatter exposes them under their public names
+def _to_json(data: Dict[str, Any], pretty: bool = True) -> str:
+    """Convert data to JSON format"""
+    return json_bytes(data, pretty).decode('utf-8')
+
+
+def _to_json_bytes(data: Dict[str, Any], pretty: bool = True) -> bytes:
+    """Convert data to UTF-8 encoded JSON, using orjson when available"""
+    return json_bytes(data, pretty)
+
+
+def _emit(d, tag, depth, child_depth, out, key_cache=None):
+    """
+    Write one element and its children to out as they are produced
+    
+    key_cache maps dict keys to tag names for the whole document, since
+    table rows repeat the same keys.
+    """
+    if key_cache is None:
+        key_cache = {}
+    indent = _INDENT[depth] if depth < len(_INDENT) else "  " * depth
+    line_indent = indent + "  "
+    out.write(f"<{tag}>\n")
+    
+    for key, value in d.items():
+        safe_key = key_cache.get(key)
+        if safe_key is None:
+            safe_key = key_cache[key] = key.translate(_XML_KEY_TBL)
+        
+        if isinstance(value, dict):
+            out.write(line_indent)
+            _emit(value, safe_key, child_depth, child_depth + 1, out, key_cache)
+            out.write("\n")
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    out.write(line_indent)
+                    _emit(item, safe_key, child_depth, child_depth + 1, out, key_cache)
+                    out.write("\n")
+                else:
+                    out.write(f"{line_indent}<{safe_key}>{item}</{safe_key}>\n")
+        else:
+            out.write(f"{line_indent}<{safe_key}>{value}</{safe_key}>\n")
+    
+    out.write(f"{indent}</{tag}>")
+
 
 class DataFormatter:
     """Format extracted data into various output formats"""
     
+    to_json = staticmethod(_to_json)
+    to_json_bytes = staticmethod(_to_json_bytes)
+    
     @staticmethod
-    def to_json(data: Dict[str, Any], pretty: bool = True) -> str:
-        """Convert data to JSON format"""
-        if pretty:
-            return json.dumps(data, indent=2, ensure_ascii=False, default=str)
-        else:
-            return json.dumps(data, ensure_ascii=False, default=str)
+    def write_json(data: Dict[str, Any], file_obj, pretty: bool = True) -> None:
+        """Serialize data as JSON directly into an open binary file"""
+        file_obj.write(json_bytes(data, pretty))
+    
+    @staticmethod
+    def to_jsonl_bytes(records: Iterable[Dict[str, Any]]) -> bytes:
+        """Convert records to JSON Lines (one compact JSON object per line)"""
+        return b"".join(_to_json_bytes(record, pretty=False) + b"\n" for record in records)
+    
+    @staticmethod
+    def write_jsonl(records: Iterable[Dict[str, Any]], file_obj) -> None:
+        """Write records as JSON Lines into an open binary file, one at a time"""
+        for record in records:
+            file_obj.write(_to_json_bytes(record, pretty=False))
+            file_obj.write(b"\n")
     
     @staticmethod
     def to_csv(data: List[Dict[str, Any]], output_path: str) -> str:
@@ -25,81 +98,95 @@ class DataFormatter:
             return "No data to convert to CSV"
         
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = list(data[0].keys())
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for row in data:
-                    # Convert nested structures to strings
-                    cleaned_row = {
-                        k: json.dumps(v) if isinstance(v, (dict, list)) else v 
-                        for k, v in row.items()
-                    }
-                    writer.writerow(cleaned_row)
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                DataFormatter._write_csv(data, csvfile)
             
             return output_path
         except Exception as e:
             return f"Error creating CSV: {str(e)}"
     
+    @staticmethod
+    def to_csv_rows(headers: List[Any], rows: List[List[Any]], output_path: str = None) -> str:
+        """
+        Write a header row plus list rows as CSV, without building a dict per row
+        
+        Returns the CSV text when no output_path is given, otherwise the path
+        """
+        if output_path is None:
+            buffer = io.StringIO()
+            DataFormatter._write_csv_rows(headers, rows, buffer)
+            return buffer.getvalue()
+        
+        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+            DataFormatter._write_csv_rows(headers, rows, csvfile)
+        return output_path
+    
+    @staticmethod
+    def _write_csv_rows(headers: List[Any], rows: List[List[Any]], csvfile) -> None:
+        """Write a header row plus list rows to an open file-like object"""
+        def cells(row):
+            # Nested structures become JSON text and NaN (from pandas) an empty cell
+            return [
+                _json_cell(v) if isinstance(v, (dict, list)) else ('' if v != v else v)
+                for v in row
+            ]
+        
+        writer = csv.writer(csvfile, lineterminator='\n')
+        writer.writerow(headers)
+        writer.writerows(map(cells, rows))
+    
+    @staticmethod
+    def _write_csv(data: List[Dict[str, Any]], csvfile) -> None:
+        """Write rows to an open file-like object as CSV"""
+        fieldnames = list(data[0].keys())
+        
+        def cells(row):
+            # Convert nested structures to strings; missing keys become empty cells
+            return [
+                _json_cell(v) if isinstance(v, (dict, list)) else v
+                for v in map(row.get, fieldnames, [''] * len(fieldnames))
+            ]
+        
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows(map(cells, data))
+    
     @staticmethod
     def to_xml(data: Dict[str, Any], root_name: str = "document") -> str:
         """Convert data to XML format"""
-        def dict_to_xml(d, root):
-            xml_str = f"<{root}>\n"
-            
-            for key, value in d.items():
-                safe_key = key.replace(' ', '_').replace('-', '_')
-                
-                if isinstance(value, dict):
-                    xml_str += f"  {DataFormatter.dict_to_xml_helper(value, safe_key, 2)}\n"
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict):
-                            xml_str += f"  {DataFormatter.dict_to_xml_helper(item, safe_key, 2)}\n"
-                        else:
-                            xml_str += f"  <{safe_key}>{item}</{safe_key}>\n"
-                else:
-                    xml_str += f"  <{safe_key}>{value}</{safe_key}>\n"
-            
-            xml_str += f"</{root}>"
-            return xml_str
-        
-        return f'<?xml version="1.0" encoding="UTF-8"?>\n{dict_to_xml(data, root_name)}'
+        out = io.StringIO()
+        DataFormatter.write_xml(data, out, root_name)
+        return out.getvalue()
+    
+    @staticmethod
+    def write_xml(data: Dict[str, Any], file_obj, root_name: str = "document") -> None:
+        """Stream data as XML into an open text file"""
+        file_obj.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        _emit(data, root_name, 0, 2, file_obj)
     
     @staticmethod
     def dict_to_xml_helper(d, tag, indent_level):
         """Helper function for XML conversion with proper indentation"""
-        indent = "  " * indent_level
-        xml_str = f"<{tag}>\n"
-        
-        for key, value in d.items():
-            safe_key = key.replace(' ', '_').replace('-', '_')
-            
-            if isinstance(value, dict):
-                xml_str += f"{indent}  {DataFormatter.dict_to_xml_helper(value, safe_key, indent_level + 1)}\n"
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        xml_str += f"{indent}  {DataFormatter.dict_to_xml_helper(item, safe_key, indent_level + 1)}\n"
-                    else:
-                        xml_str += f"{indent}  <{safe_key}>{item}</{safe_key}>\n"
-            else:
-                xml_str += f"{indent}  <{safe_key}>{value}</{safe_key}>\n"
-        
-        xml_str += f"{indent}</{tag}>"
-        return xml_str
+        out = io.StringIO()
+        _emit(d, tag, indent_level, indent_level + 1, out)
+        return out.getvalue()
     
     @staticmethod
-    def create_ai_training_format(data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_ai_training_format(data: Dict[str, Any], word_count: int = None) -> Dict[str, Any]:
         """
         Create a standardized format optimized for AI training
         
+        Pass word_count when it is already known (e.g. from get_statistics)
+        so full_text is not counted a second time.
+        
         Returns a structure with:
         - input: The main content
         - metadata: Document metadata
         - features: Extracted features for ML
         """
+        if word_count is None:
+            word_count = count_words(data.get("full_text", ""))
+        
         ai_format = {
             "input_text": "",
             "metadata": {},
@@ -118,7 +205,7 @@ class DataFormatter:
         # Extract features
         ai_format["features"] = {
             "document_type": data.get("document_type", "unknown"),
-            "word_count": len(data.get("full_text", "").split()),
+            "word_count": word_count,
             "has_tables": "tables" in data and len(data.get("tables", [])) > 0,
             "has_structure": "pages" in data or "paragraphs" in data
         }
@@ -132,8 +219,68 @@ class DataFormatter:
         return ai_format
     
     @staticmethod
-    def get_statistics(data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate statistics about the extracted data"""
+    def iter_records(table: Any) -> Iterator[Dict[str, Any]]:
+        """Iterate row dicts from a list of records or a {column: [values]} dict"""
+        if isinstance(table, dict):
+            columns = list(table)
+            return (dict(zip(columns, values)) for values in zip(*table.values()))
+        return iter(table)
+    
+    @staticmethod
+    def iter_ai_training_records(data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield AI training records one at a time, for JSON Lines output
+        
+        Every page, paragraph, text line or table row becomes its own record
+        so the dataset never has to be built as one big list.
+        """
+        document_type = data.get("document_type", "unknown")
+        
+        if "pages" in data:
+            units = (
+                (page["text"], {"page_number": page["page_number"]})
+                for page in data["pages"]
+            )
+        elif "paragraphs" in data:
+            units = (
+                (paragraph["text"], {"paragraph": index, "style": paragraph["style"]})
+                for index, paragraph in enumerate(data["paragraphs"], 1)
+            )
+        elif "lines" in data:
+            units = (
+                (line["text"], {"line_number": line["line_number"]})
+                for line in data["lines"]
+            )
+        elif "data" in data or "all_data" in data:
+            rows = DataFormatter.iter_records(data.get("data", data.get("all_data")))
+            for index, row in enumerate(rows, 1):
+                yield {
+                    "input_text": ", ".join(f"{key}: {value}" for key, value in row.items()),
+                    "document_type": document_type,
+                    "source": {"row": index},
+                    "structured_data": row
+                }
+            return
+        else:
+            units = [(data.get("full_text", ""), {})]
+        
+        for text, source in units:
+            if text.strip():
+                yield {
+                    "input_text": text,
+                    "document_type": document_type,
+                    "source": source
+                }
+    
+    @staticmethod
+    def get_statistics(data: Dict[str, Any], text_cleaned: bool = False) -> Dict[str, Any]:
+        """
+        Generate statistics about the extracted data
+        
+        Converters that count while extracting provide total_words and
+        total_characters; those describe the raw text, so the text is only
+        recounted when it was cleaned afterwards.
+        """
         stats = {
             "document_type": data.get("document_type", "Unknown"),
             "total_size": 0,
@@ -144,10 +291,13 @@ class DataFormatter:
         }
         
         # Text statistics
-        if "full_text" in data:
+        if not text_cleaned and "total_words" in data and "total_characters" in data:
+            stats["text_length"] = data["total_characters"]
+            stats["word_count"] = data["total_words"]
+        elif "full_text" in data:
             text = data["full_text"]
             stats["text_length"] = len(text)
-            stats["word_count"] = len(text.split())
+            stats["word_count"] = count_words(text)
         
         # Table statistics
         if "tables" in data:
@@ -2,8 +2,7 @@
 File validator for checking file types and sizes
 """
 import os
-import magic
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 
 class FileValidator:
@@ -19,39 +18,130 @@ class FileValidator:
         '.csv': 'CSV File',
         '.txt': 'Text File'
     }
+    _EXT_SET = frozenset(SUPPORTED_EXTENSIONS)
+    _SUPPORTED_LIST_STR = ', '.join(SUPPORTED_EXTENSIONS.keys())
     
     # Maximum file size (50MB)
     MAX_FILE_SIZE = 50 * 1024 * 1024
     
+    # Leading bytes accepted for binary formats (OOXML files are ZIP archives).
+    # The backends detect the format from content, so legacy extensions also
+    # take ZIP: a .docx saved as .doc or an .xlsx saved as .xls converts fine
+    ZIP_SIGNATURE = b'PK\x03\x04'
+    OLE_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+    FILE_SIGNATURES = {
+        '.docx': (ZIP_SIGNATURE,),
+        '.xlsx': (ZIP_SIGNATURE,),
+        '.doc': (ZIP_SIGNATURE, OLE_SIGNATURE),
+        '.xls': (ZIP_SIGNATURE, OLE_SIGNATURE)
+    }
+    
+    # Signature -> detected kind, for sniffing files whatever their extension
+    _SIGS = {
+        b'%PDF-': '.pdf',
+        ZIP_SIGNATURE: 'zip',  # .docx, .xlsx or any other ZIP container
+        OLE_SIGNATURE: 'ole'   # .doc, .xls or an encrypted .docx/.xlsx
+    }
+    
+    # PDF headers may be preceded by junk, but must appear in the first 1KB
+    SNIFF_SIZE = 1024
+    
     @staticmethod
-    def validate_file(file_path: str) -> Tuple[bool, str]:
+    def validate_file(file_path: str, ext: str = None) -> Tuple[bool, str]:
         """
-        Validate if file is supported and within size limits
+        Validate if file is supported, within size limits and readable
+        
+        Checks run cheapest first (extension, size, leading bytes) so bad files
+        are rejected before any converter backend is loaded.
+        
+        Args:
+            file_path: Path to the file
+            ext: Lower-case extension, if the caller already has it
         
         Returns:
             Tuple of (is_valid, message)
         """
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Check if file exists; one stat also provides the size
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
             return False, "File does not exist"
         
         # Check file extension
-        _, ext = os.path.splitext(file_path)
-        ext = ext.lower()
+        if ext is None:
+            _, ext = os.path.splitext(file_path)
+            ext = ext.lower()
         
-        if ext not in FileValidator.SUPPORTED_EXTENSIONS:
-            return False, f"Unsupported file type: {ext}. Supported types: {', '.join(FileValidator.SUPPORTED_EXTENSIONS.keys())}"
+        if ext not in FileValidator._EXT_SET:
+            return False, f"Unsupported file type: {ext}. Supported types: {FileValidator._SUPPORTED_LIST_STR}"
         
         # Check file size
-        file_size = os.path.getsize(file_path)
         if file_size > FileValidator.MAX_FILE_SIZE:
             return False, f"File too large: {file_size / (1024*1024):.2f}MB. Maximum size: {FileValidator.MAX_FILE_SIZE / (1024*1024)}MB"
         
         if file_size == 0:
             return False, "File is empty"
         
+        # Check the leading bytes match the extension
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(FileValidator.SNIFF_SIZE)
+        except OSError as e:
+            return False, f"Cannot read file: {e.strerror or e}"
+        
+        if ext == '.pdf':
+            if b'%PDF-' not in head:
+                return False, "File content does not look like a PDF"
+            if FileValidator._pdf_needs_password(file_path):
+                return False, "Password-protected PDFs are not supported"
+        elif ext in FileValidator.FILE_SIGNATURES:
+            if ext in ('.docx', '.xlsx') and head.startswith(FileValidator.OLE_SIGNATURE):
+                # Encrypted OOXML files are stored in an OLE container
+                return False, "Password-protected Office files are not supported"
+            if not head.startswith(FileValidator.FILE_SIGNATURES[ext]):
+                return False, f"File content does not match its {ext} extension"
+        
         return True, f"Valid {FileValidator.SUPPORTED_EXTENSIONS[ext]}"
     
+    @staticmethod
+    def _pdf_needs_password(file_path: str) -> bool:
+        """Check PDF encryption by opening only the document trailer"""
+        import fitz  # PyMuPDF; imported here so validating other types stays light
+        
+        try:
+            with fitz.open(file_path) as doc:
+                return doc.needs_pass
+        except Exception:
+            # Let the converter report damaged files with its own message
+            return False
+    
+    @staticmethod
+    def sniff(file_path: str) -> Optional[str]:
+        """
+        Detect the container format from the leading bytes
+        
+        Returns:
+            '.pdf', 'zip', 'ole', or None when no known signature matches
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(FileValidator.SNIFF_SIZE)
+        
+        for signature, kind in FileValidator._SIGS.items():
+            if head.startswith(signature):
+                return kind
+        
+        # PDF readers accept a header preceded by junk
+        if b'%PDF-' in head:
+            return '.pdf'
+        return None
+    
+    @staticmethod
+    def add_extension(ext: str, description: str) -> None:
+        """Accept another extension, e.g. one with a converter registered at runtime"""
+        FileValidator.SUPPORTED_EXTENSIONS.setdefault(ext, description)
+        FileValidator._EXT_SET = frozenset(FileValidator.SUPPORTED_EXTENSIONS)
+        FileValidator._SUPPORTED_LIST_STR = ', '.join(FileValidator.SUPPORTED_EXTENSIONS.keys())
+    
     @staticmethod
     def get_file_type(file_path: str) -> str:
         """Get the file type description"""
@@ -63,7 +153,7 @@ class FileValidator:
     def is_supported(file_path: str) -> bool:
         """Check if file type is supported"""
         _, ext = os.path.splitext(file_path)
-        return ext.lower() in FileValidator.SUPPORTED_EXTENSIONS
+        return ext.lower() in FileValidator._EXT_SET
     
     @staticmethod
     def get_supported_extensions() -> List[str]: